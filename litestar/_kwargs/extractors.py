@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from functools import lru_cache
+import linecache
+from itertools import count
+from operator import attrgetter, methodcaller
 from typing import TYPE_CHECKING, Any, Callable, Coroutine, cast
 
 from litestar._multipart import parse_multipart_form
@@ -11,7 +12,7 @@ from litestar._parsers import (
     parse_url_encoded_form_data,
 )
 from litestar.datastructures.upload_file import UploadFile
-from litestar.enums import ParamType, RequestEncodingType
+from litestar.enums import RequestEncodingType
 from litestar.exceptions import ValidationException
 from litestar.params import BodyKwarg
 from litestar.types import Empty
@@ -25,26 +26,31 @@ if TYPE_CHECKING:
 
 
 __all__ = (
-    "body_extractor",
-    "cookies_extractor",
     "create_connection_value_extractor",
     "create_data_extractor",
     "create_multipart_extractor",
-    "create_query_default_dict",
+    "create_reserved_kwargs_extractor",
     "create_url_encoded_data_extractor",
-    "headers_extractor",
     "json_extractor",
     "msgpack_extractor",
     "parse_connection_headers",
     "parse_connection_query_params",
-    "query_extractor",
-    "request_extractor",
-    "scope_extractor",
-    "socket_extractor",
-    "state_extractor",
+    "RESERVED_KWARG_GETTERS",
 )
 
 
+# default values of these types are inlined into the generated extractors as constants
+_LITERAL_DEFAULT_TYPES = (bool, bytes, int, str)
+
+
+# generated extractors are compiled under unique filenames, so their source can be registered with linecache
+_extractor_ids = count()
+
+
+def _missing_parameter_exception(alias: str, connection: ASGIConnection) -> ValidationException:
+    return ValidationException(f"Missing required parameter {alias} for url {connection.url}")
+
+
 def create_connection_value_extractor(
     kwargs_model: KwargsModel,
     connection_key: str,
@@ -63,57 +69,58 @@ def create_connection_value_extractor(
         An extractor function.
     """
 
-    alias_and_key_tuple = tuple(
-        (p.field_alias.lower() if p.param_type == ParamType.HEADER else p.field_alias, p.field_name)
-        for p in expected_params
-    )
-    alias_defaults = {
-        p.field_alias.lower() if p.param_type == ParamType.HEADER else p.field_alias: p.default
-        for p in expected_params
-        if not (p.is_required or p.default is Ellipsis)
+    params = tuple(expected_params)
+    aliases = tuple(p.field_alias for p in params)
+    keys = tuple(p.field_name for p in params)
+    # required parameters are marked with 'Empty' in place of a default value
+    defaults = tuple(Empty if p.is_required or p.default is Ellipsis else p.default for p in params)
+
+    # the extractor is generated as straight-line source, with the aliases and keys inlined as literals, so the
+    # per-request work is reduced to the dict lookups themselves.
+    namespace: dict[str, Any] = {
+        "kwargs_model": kwargs_model,
+        "parser": parser,
+        "missing_parameter_exception": _missing_parameter_exception,
     }
-
-    def extractor(values: dict[str, Any], connection: ASGIConnection) -> None:
-        data = parser(connection, kwargs_model) if parser else getattr(connection, connection_key, {})
-
-        try:
-            connection_mapping: dict[str, Any] = {
-                key: data[alias] if alias in data else alias_defaults[alias] for alias, key in alias_and_key_tuple
-            }
-            values.update(connection_mapping)
-        except KeyError as e:
-            raise ValidationException(f"Missing required parameter {e.args[0]} for url {connection.url}") from e
-
-    return extractor
-
-
-@lru_cache(1024)
-def create_query_default_dict(
-    parsed_query: tuple[tuple[str, str], ...], sequence_query_parameter_names: tuple[str, ...]
-) -> defaultdict[str, list[str] | str]:
-    """Transform a list of tuples into a default dict. Ensures non-list values are not wrapped in a list.
-
-    Args:
-        parsed_query: The parsed query list of tuples.
-        sequence_query_parameter_names: A set of query parameters that should be wrapped in list.
-
-    Returns:
-        A default dict
-    """
-    output: defaultdict[str, list[str] | str] = defaultdict(list)
-
-    for k, v in parsed_query:
-        if k in sequence_query_parameter_names:
-            output[k].append(v)  # type: ignore
+    lines = [
+        "def extractor(values, connection):",
+        "    data = parser(connection, kwargs_model)"
+        if parser
+        else f"    data = getattr(connection, {connection_key!r}, {{}})",
+    ]
+    if required := [i for i, default in enumerate(defaults) if default is Empty]:
+        lines.append("    try:")
+        lines.extend(f"        values[{keys[i]!r}] = data[{aliases[i]!r}]" for i in required)
+        lines.extend(("    except KeyError as e:", "        raise missing_parameter_exception(e.args[0], connection) from e"))
+    elif params:
+        # if all parameters are optional and none were sent, e.g. a request without a query string, the defaults are
+        # copied over in a single update
+        namespace["defaults_template"] = dict(zip(keys, defaults))
+        lines.extend(("    if not data:", "        values.update(defaults_template)", "        return"))
+    for i, default in enumerate(defaults):
+        if default is Empty:
+            continue
+        if default is None or type(default) in _LITERAL_DEFAULT_TYPES:
+            default_source = repr(default)
         else:
-            output[k] = v
-
-    return output
+            namespace[f"default_{i}"] = default
+            default_source = f"default_{i}"
+        lines.append(f"    values[{keys[i]!r}] = data.get({aliases[i]!r}, {default_source})")
+
+    source = "\n".join(lines)
+    filename = f"<litestar {connection_key} extractor {next(_extractor_ids)}>"
+    # registering the source lets tracebacks through the generated extractor show its lines
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    exec(compile(source, filename, "exec"), namespace)  # noqa: S102
+    extractor: Callable[[dict[str, Any], ASGIConnection], None] = namespace["extractor"]
+    return extractor
 
 
 def parse_connection_query_params(connection: ASGIConnection, kwargs_model: KwargsModel) -> dict[str, Any]:
     """Parse query params and cache the result in scope.
 
+    Values of query parameters that are expected to be sequences are collected into lists.
+
     Args:
         connection: The ASGI connection instance.
         kwargs_model: The KwargsModel instance.
@@ -121,14 +128,20 @@ def parse_connection_query_params(connection: ASGIConnection, kwargs_model: Kwar
     Returns:
         A dictionary of parsed values.
     """
-    parsed_query = connection.scope["_parsed_query"] = (  # type: ignore
-        connection._parsed_query
-        if connection._parsed_query is not Empty
-        else parse_query_string(connection.scope.get("query_string", b""))
-    )
-    return create_query_default_dict(
-        parsed_query=parsed_query, sequence_query_parameter_names=kwargs_model.sequence_query_parameter_names
-    )
+    scope = connection.scope
+    parsed_query: tuple[tuple[str, Any], ...] | None = scope.get("_parsed_query")  # type: ignore[assignment]
+    if parsed_query is None:
+        parsed_query = scope["_parsed_query"] = parse_query_string(  # type: ignore[typeddict-unknown-key]
+            scope.get("query_string", b"")
+        )
+    sequence_query_parameter_names = kwargs_model.sequence_query_parameter_names
+    output: dict[str, Any] = {}
+    for k, v in parsed_query:
+        if k in sequence_query_parameter_names:
+            output.setdefault(k, []).append(v)
+        else:
+            output[k] = v
+    return output
 
 
 def parse_connection_headers(connection: ASGIConnection, _: KwargsModel) -> dict[str, Any]:
@@ -142,119 +155,48 @@ def parse_connection_headers(connection: ASGIConnection, _: KwargsModel) -> dict
         A dictionary of parsed values
     """
     parsed_headers = connection.scope["_headers"] = (  # type: ignore
-        connection._headers if connection._headers is not Empty else parse_headers(tuple(connection.scope["headers"]))
+        connection._headers if connection._headers is not Empty else parse_headers(connection.scope["headers"])
     )
     return cast("dict[str, Any]", parsed_headers)
 
 
-def state_extractor(values: dict[str, Any], connection: ASGIConnection) -> None:
-    """Extract the app state from the connection and insert it to the kwargs injected to the handler.
-
-    Args:
-        connection: The ASGI connection instance.
-        values: The kwargs that are extracted from the connection and will be injected into the handler.
-
-    Returns:
-        None
-    """
-    values["state"] = connection.app.state._state
-
-
-def headers_extractor(values: dict[str, Any], connection: ASGIConnection) -> None:
-    """Extract the headers from the connection and insert them to the kwargs injected to the handler.
-
-    Args:
-        connection: The ASGI connection instance.
-        values: The kwargs that are extracted from the connection and will be injected into the handler.
-
-    Returns:
-        None
-    """
-    values["headers"] = connection.headers
-
-
-def cookies_extractor(values: dict[str, Any], connection: ASGIConnection) -> None:
-    """Extract the cookies from the connection and insert them to the kwargs injected to the handler.
-
-    Args:
-        connection: The ASGI connection instance.
-        values: The kwargs that are extracted from the connection and will be injected into the handler.
-
-    Returns:
-        None
-    """
-    values["cookies"] = connection.cookies
-
-
-def query_extractor(values: dict[str, Any], connection: ASGIConnection) -> None:
-    """Extract the query params from the connection and insert them to the kwargs injected to the handler.
-
-    Args:
-        connection: The ASGI connection instance.
-        values: The kwargs that are extracted from the connection and will be injected into the handler.
-
-    Returns:
-        None
-    """
-    values["query"] = connection.query_params
-
-
-def scope_extractor(values: dict[str, Any], connection: ASGIConnection) -> None:
-    """Extract the scope from the connection and insert it into the kwargs injected to the handler.
-
-    Args:
-        connection: The ASGI connection instance.
-        values: The kwargs that are extracted from the connection and will be injected into the handler.
-
-    Returns:
-        None
-    """
-    values["scope"] = connection.scope
-
-
-def request_extractor(values: dict[str, Any], connection: ASGIConnection) -> None:
-    """Set the connection instance as the 'request' value in the kwargs injected to the handler.
+def _get_connection(connection: ASGIConnection) -> ASGIConnection:
+    return connection
 
-    Args:
-        connection: The ASGI connection instance.
-        values: The kwargs that are extracted from the connection and will be injected into the handler.
 
-    Returns:
-        None
-    """
-    values["request"] = connection
+# getters for the reserved kwargs that are read directly off the connection. Note that the 'body' getter returns a
+# Coroutine, which is resolved at a later stage.
+RESERVED_KWARG_GETTERS: dict[str, Callable[[ASGIConnection], Any]] = {
+    "body": methodcaller("body"),
+    "cookies": attrgetter("cookies"),
+    "headers": attrgetter("headers"),
+    "query": attrgetter("query_params"),
+    "request": _get_connection,
+    "scope": attrgetter("scope"),
+    "socket": _get_connection,
+    "state": attrgetter("app.state._state"),
+}
 
 
-def socket_extractor(values: dict[str, Any], connection: ASGIConnection) -> None:
-    """Set the connection instance as the 'socket' value in the kwargs injected to the handler.
+def create_reserved_kwargs_extractor(
+    reserved_kwargs: set[str],
+) -> Callable[[dict[str, Any], ASGIConnection], None]:
+    """Create an extractor for reserved kwargs that are read directly off the connection, such as 'request' or 'state'.
 
     Args:
-        connection: The ASGI connection instance.
-        values: The kwargs that are extracted from the connection and will be injected into the handler.
+        reserved_kwargs: The names of the reserved kwargs to extract.
 
     Returns:
-        None
+        An extractor function.
     """
-    values["socket"] = connection
-
-
-def body_extractor(
-    values: dict[str, Any],
-    connection: Request[Any, Any, Any],
-) -> None:
-    """Extract the body from the request instance.
+    # the keys are taken from the getters table, so the values are stored under the module's interned literals
+    getters = tuple((key, getter) for key, getter in RESERVED_KWARG_GETTERS.items() if key in reserved_kwargs)
 
-    Notes:
-        - this extractor sets a Coroutine as the value in the kwargs. These are resolved at a later stage.
-
-    Args:
-        connection: The ASGI connection instance.
-        values: The kwargs that are extracted from the connection and will be injected into the handler.
+    def extractor(values: dict[str, Any], connection: ASGIConnection) -> None:
+        for key, getter in getters:
+            values[key] = getter(connection)
 
-    Returns:
-        The Body value.
-    """
-    values["body"] = connection.body()
+    return extractor
 
 
 async def json_extractor(connection: Request[Any, Any, Any]) -> Any:
@@ -312,21 +254,19 @@ def create_multipart_extractor(
             if body_kwarg_multipart_form_part_limit is not None
             else connection.app.multipart_form_part_limit
         )
-        connection.scope["_form"] = form_values = (  # type: ignore[typeddict-unknown-key]
-            connection.scope["_form"]  # type: ignore[typeddict-item]
-            if "_form" in connection.scope
-            else parse_multipart_form(
+        form_values: dict[str, Any] | None = connection.scope.get("_form")  # type: ignore[assignment]
+        if form_values is None:
+            form_values = connection.scope["_form"] = parse_multipart_form(  # type: ignore[typeddict-unknown-key]
                 body=await connection.body(),
                 boundary=connection.content_type[-1].get("boundary", "").encode(),
                 multipart_form_part_limit=multipart_form_part_limit,
                 type_decoders=connection.route_handler.resolve_type_decoders(),
             )
-        )
 
         if field_definition.is_non_string_sequence:
             return list(form_values.values())
         if field_definition.is_simple_type and field_definition.annotation is UploadFile and form_values:
-            return next(v for v in form_values.values() if isinstance(v, UploadFile))
+            return next((v for v in form_values.values() if isinstance(v, UploadFile)), None)
 
         if not form_values and is_data_optional:
             return None
@@ -352,11 +292,11 @@ def create_url_encoded_data_extractor(
     async def extract_url_encoded_extractor(
         connection: Request[Any, Any, Any],
     ) -> Any:
-        connection.scope["_form"] = form_values = (  # type: ignore[typeddict-unknown-key]
-            connection.scope["_form"]  # type: ignore[typeddict-item]
-            if "_form" in connection.scope
-            else parse_url_encoded_form_data(await connection.body())
-        )
+        form_values: dict[str, Any] | None = connection.scope.get("_form")  # type: ignore[assignment]
+        if form_values is None:
+            form_values = connection.scope["_form"] = parse_url_encoded_form_data(  # type: ignore[typeddict-unknown-key]
+                await connection.body()
+            )
 
         if not form_values and is_data_optional:
             return None
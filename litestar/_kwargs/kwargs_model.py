@@ -11,18 +11,11 @@ from litestar._kwargs.dependencies import (
     resolve_dependency,
 )
 from litestar._kwargs.extractors import (
-    body_extractor,
-    cookies_extractor,
     create_connection_value_extractor,
     create_data_extractor,
-    headers_extractor,
+    create_reserved_kwargs_extractor,
     parse_connection_headers,
     parse_connection_query_params,
-    query_extractor,
-    request_extractor,
-    scope_extractor,
-    socket_extractor,
-    state_extractor,
 )
 from litestar._kwargs.parameter_definition import (
     ParameterDefinition,
@@ -106,7 +99,7 @@ class KwargsModel:
         self.expected_query_params = expected_query_params
         self.expected_reserved_kwargs = expected_reserved_kwargs
         self.expected_data_dto = expected_data_dto
-        self.sequence_query_parameter_names = tuple(sequence_query_parameter_names)
+        self.sequence_query_parameter_names = frozenset(sequence_query_parameter_names)
 
         self.has_kwargs = (
             expected_cookie_params
@@ -124,22 +117,15 @@ class KwargsModel:
         self.extractors = self._create_extractors()
         self.dependency_batches = create_dependency_batches(expected_dependencies)
 
-    def _create_extractors(self) -> list[Callable[[dict[str, Any], ASGIConnection], None]]:
-        reserved_kwargs_extractors: dict[str, Callable[[dict[str, Any], ASGIConnection], None]] = {
-            "data": create_data_extractor(self),
-            "state": state_extractor,
-            "scope": scope_extractor,
-            "request": request_extractor,
-            "socket": socket_extractor,
-            "headers": headers_extractor,
-            "cookies": cookies_extractor,
-            "query": query_extractor,
-            "body": body_extractor,  # type: ignore
-        }
+    def _create_extractors(self) -> tuple[Callable[[dict[str, Any], ASGIConnection], None], ...]:
+        extractors: list[Callable[[dict[str, Any], ASGIConnection], None]] = []
+
+        # the data extractor is only created for handlers that request the 'data' kwarg
+        if "data" in self.expected_reserved_kwargs:
+            extractors.append(create_data_extractor(self))
 
-        extractors: list[Callable[[dict[str, Any], ASGIConnection], None]] = [
-            reserved_kwargs_extractors[reserved_kwarg] for reserved_kwarg in self.expected_reserved_kwargs
-        ]
+        if connection_reserved_kwargs := self.expected_reserved_kwargs.difference(("data",)):
+            extractors.append(create_reserved_kwargs_extractor(connection_reserved_kwargs))
 
         if self.expected_header_params:
             extractors.append(
@@ -178,7 +164,7 @@ class KwargsModel:
                     parser=parse_connection_query_params,
                 ),
             )
-        return extractors
+        return tuple(extractors)
 
     @classmethod
     def _get_param_definitions(
@@ -49,7 +49,8 @@ def create_parameter_definition(
         field_alias = field_name
         param_type = ParamType.PATH
     elif kwarg_definition and kwarg_definition.header:
-        field_alias = kwarg_definition.header
+        # parsed header names are lower-cased, so the alias is normalized once here
+        field_alias = kwarg_definition.header.lower()
         param_type = ParamType.HEADER
     elif kwarg_definition and kwarg_definition.cookie:
         field_alias = kwarg_definition.cookie
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from inspect import cleandoc
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, get_args
 
 from litestar._openapi.parameters import create_parameter_for_handler
 from litestar._openapi.request_body import create_request_body
@@ -9,17 +10,30 @@ from litestar._openapi.responses import create_responses
 from litestar._openapi.schema_generation import SchemaCreator
 from litestar._openapi.utils import SEPARATORS_CLEANUP_PATTERN
 from litestar.openapi.spec.path_item import PathItem
+from litestar.types import Method
 from litestar.utils.helpers import unwrap_partial
 
 __all__ = ("create_path_item", "extract_layered_values", "get_description_for_handler")
 
 if TYPE_CHECKING:
     from litestar.handlers.http_handlers import HTTPRouteHandler
-    from litestar.openapi.spec import Schema, SecurityRequirement
+    from litestar.openapi.spec import Schema
     from litestar.plugins import OpenAPISchemaPluginProtocol
     from litestar.routes import HTTPRoute
     from litestar.types.callable_types import OperationIDCreator
 
+_PATH_ITEM_ATTRIBUTES = {method: method.lower() for method in get_args(Method)}
+
+
+@lru_cache(1024)
+def _clean_docstring(docstring: str) -> str:
+    return cleandoc(docstring)
+
+
+@lru_cache(1024)
+def _create_default_summary(handler_name: str) -> str:
+    return SEPARATORS_CLEANUP_PATTERN.sub("", handler_name.title())
+
 
 def get_description_for_handler(route_handler: HTTPRouteHandler, use_handler_docstrings: bool) -> str | None:
     """Produce the operation description for a route handler, either by using the description value if provided,
@@ -37,7 +51,7 @@ def get_description_for_handler(route_handler: HTTPRouteHandler, use_handler_doc
     handler_description = route_handler.description
     if handler_description is None and use_handler_docstrings:
         fn = unwrap_partial(route_handler.fn.value)
-        return cleandoc(fn.__doc__) if fn.__doc__ else None
+        return _clean_docstring(fn.__doc__) if fn.__doc__ else None
     return handler_description
 
 
@@ -52,14 +66,7 @@ def extract_layered_values(
     Returns:
         A tuple of optional lists.
     """
-    tags: list[str] = []
-    security: list[SecurityRequirement] = []
-    for layer in route_handler.ownership_layers:
-        if layer.tags:
-            tags.extend(layer.tags)
-        if layer.security:
-            security.extend(layer.security)
-    return sorted(set(tags)) if tags else None, security or None
+    return list(route_handler.resolve_tags()) or None, list(route_handler.resolve_security()) or None
 
 
 def create_path_item(
@@ -86,56 +93,54 @@ def create_path_item(
     path_item = PathItem()
     operation_ids: list[str] = []
 
-    request_schema_creator = SchemaCreator(create_examples, plugins, schemas, prefer_alias=True)
-    response_schema_creator = SchemaCreator(create_examples, plugins, schemas, prefer_alias=True)
-    for http_method, handler_tuple in route.route_handler_map.items():
-        route_handler, _ = handler_tuple
-
-        if route_handler.include_in_schema:
-            handler_fields = route_handler.signature_model._fields if route_handler.signature_model else {}
-            parameters = (
-                create_parameter_for_handler(
-                    route_handler=route_handler,
-                    handler_fields=handler_fields,
-                    path_parameters=route.path_parameters,
-                    schema_creator=request_schema_creator,
-                )
-                or None
-            )
-            raises_validation_error = bool("data" in handler_fields or path_item.parameters or parameters)
-
-            request_body = None
-            if "data" in handler_fields:
-                request_body = create_request_body(
-                    route_handler=route_handler,
-                    field_definition=handler_fields["data"],
-                    schema_creator=request_schema_creator,
-                )
-
-            if isinstance(route_handler.operation_id, str):
-                operation_id = route_handler.operation_id
-            elif callable(route_handler.operation_id):
-                operation_id = route_handler.operation_id(route_handler, http_method, route.path_components)
-            else:
-                operation_id = operation_id_creator(route_handler, http_method, route.path_components)
-
-            tags, security = extract_layered_values(route_handler)
-            operation = route_handler.operation_class(
-                operation_id=operation_id,
-                tags=tags,
-                summary=route_handler.summary or SEPARATORS_CLEANUP_PATTERN.sub("", route_handler.handler_name.title()),
-                description=get_description_for_handler(route_handler, use_handler_docstrings),
-                deprecated=route_handler.deprecated,
-                responses=create_responses(
-                    route_handler=route_handler,
-                    raises_validation_error=raises_validation_error,
-                    schema_creator=response_schema_creator,
-                ),
-                request_body=request_body,
-                parameters=parameters,  # type: ignore[arg-type]
-                security=security,
+    schema_creator = SchemaCreator(create_examples, plugins, schemas, prefer_alias=True)
+    for http_method, (route_handler, _) in route.route_handler_map.items():
+        if not route_handler.include_in_schema:
+            continue
+
+        handler_fields = route_handler.signature_model._fields
+        parameters = create_parameter_for_handler(
+            route_handler=route_handler,
+            handler_fields=handler_fields,
+            path_parameters=route.path_parameters,
+            schema_creator=schema_creator,
+        )
+        has_data = "data" in handler_fields
+        raises_validation_error = has_data or bool(parameters) or bool(path_item.parameters)
+
+        request_body = None
+        if has_data:
+            request_body = create_request_body(
+                route_handler=route_handler,
+                field_definition=handler_fields["data"],
+                schema_creator=schema_creator,
             )
-            operation_ids.append(operation_id)
-            setattr(path_item, http_method.lower(), operation)
+
+        handler_operation_id = route_handler.operation_id
+        if isinstance(handler_operation_id, str):
+            operation_id = handler_operation_id
+        elif callable(handler_operation_id):
+            operation_id = handler_operation_id(route_handler, http_method, route.path_components)
+        else:
+            operation_id = operation_id_creator(route_handler, http_method, route.path_components)
+
+        tags, security = extract_layered_values(route_handler)
+        operation = route_handler.operation_class(
+            operation_id=operation_id,
+            tags=tags,
+            summary=route_handler.summary or _create_default_summary(route_handler.handler_name),
+            description=get_description_for_handler(route_handler, use_handler_docstrings),
+            deprecated=route_handler.deprecated,
+            responses=create_responses(
+                route_handler=route_handler,
+                raises_validation_error=raises_validation_error,
+                schema_creator=schema_creator,
+            ),
+            request_body=request_body,
+            parameters=parameters or None,  # type: ignore[arg-type]
+            security=security,
+        )
+        operation_ids.append(operation_id)
+        setattr(path_item, _PATH_ITEM_ATTRIBUTES[http_method], operation)
 
     return path_item, operation_ids
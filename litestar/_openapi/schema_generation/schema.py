@@ -271,10 +271,10 @@ class SchemaCreator:
             result = self.for_dataclass(field_definition.annotation)
         elif is_typed_dict(field_definition.annotation):
             result = self.for_typed_dict(field_definition.annotation)
-        elif plugins_for_annotation := [
-            plugin for plugin in self.plugins if plugin.is_plugin_supported_type(field_definition.annotation)
-        ]:
-            result = self.for_plugin(field_definition, plugins_for_annotation[0])
+        elif plugin_for_annotation := next(
+            (plugin for plugin in self.plugins if plugin.is_plugin_supported_type(field_definition.annotation)), None
+        ):
+            result = self.for_plugin(field_definition, plugin_for_annotation)
         elif is_pydantic_constrained_field(field_definition.annotation) or (
             isinstance(field_definition.kwarg_definition, (ParameterKwarg, BodyKwarg))
             and field_definition.kwarg_definition.is_constrained
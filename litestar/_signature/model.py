@@ -136,7 +136,7 @@ class SignatureModel(Struct):
             An ErrorMessage
         """
 
-        message: ErrorMessage = {"message": exc_msg.split(" - ")[0]}
+        message: ErrorMessage = {"message": exc_msg.partition(" - ")[0]}
 
         if keys:
             message["key"] = key = ".".join(keys)
@@ -187,7 +187,7 @@ class SignatureModel(Struct):
         messages: list[ErrorMessage] = []
         deserializer = partial(_deserializer, default_deserializer=connection.route_handler.default_deserializer)
         try:
-            return convert(kwargs, cls, strict=False, dec_hook=deserializer, str_keys=True).to_dict()
+            return asdict(convert(kwargs, cls, strict=False, dec_hook=deserializer, str_keys=True))
         except ExtendedMsgSpecValidationError as e:
             for exc in e.errors:
                 keys = [str(loc) for loc in exc["loc"]]
@@ -195,10 +195,11 @@ class SignatureModel(Struct):
                 messages.append(message)
             raise cls._create_exception(messages=messages, connection=connection) from e
         except ValidationError as e:
+            exc_msg = str(e)
             for field_name, exc in cls._collect_errors(deserializer=deserializer, **kwargs):  # type: ignore[assignment]
                 match = ERR_RE.search(str(exc))
                 keys = [field_name, str(match.group(1))] if match else [field_name]
-                message = cls._build_error_message(keys=keys, exc_msg=str(e), connection=connection)
+                message = cls._build_error_message(keys=keys, exc_msg=exc_msg, connection=connection)
                 messages.append(message)
             raise cls._create_exception(messages=messages, connection=connection) from e
 
@@ -235,7 +236,9 @@ class SignatureModel(Struct):
             if isinstance(field_definition.kwarg_definition, KwargDefinition):
                 meta_kwargs: dict[str, Any] = {"extra": {}}
 
-                kwarg_definition = simple_asdict(field_definition.kwarg_definition, exclude_empty=True)
+                kwarg_definition = simple_asdict(
+                    field_definition.kwarg_definition, exclude_empty=True, convert_nested=False
+                )
                 if min_items := kwarg_definition.pop("min_items", None):
                     meta_kwargs["min_length"] = min_items
                 if max_items := kwarg_definition.pop("max_items", None):
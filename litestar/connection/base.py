@@ -148,7 +148,7 @@ class ASGIConnection(Generic[HandlerT, UserT, AuthT, StateT]):
         """
         if self._headers is Empty:
             self.scope.setdefault("headers", [])
-            self._headers = self.scope["_headers"] = parse_headers(tuple(self.scope["headers"]))  # type: ignore[typeddict-unknown-key]
+            self._headers = self.scope["_headers"] = parse_headers(self.scope["headers"])  # type: ignore[typeddict-unknown-key]
 
         return Headers(self._headers)
 
@@ -41,7 +41,6 @@ class MakoTemplate(TemplateProtocol):
             template: Base ``MakoTemplate`` used by the underlying mako-engine
             template_callables: List of callables passed to the template
         """
-        super().__init__()
         self.template = template
         self.template_callables = template_callables
 
@@ -65,17 +64,22 @@ class MakoTemplate(TemplateProtocol):
 class MakoTemplateEngine(TemplateEngineProtocol[MakoTemplate]):
     """Mako based TemplateEngine."""
 
-    def __init__(self, directory: DirectoryPath | list[DirectoryPath]) -> None:
+    def __init__(self, directory: DirectoryPath | list[DirectoryPath], module_directory: str | None = None) -> None:
         """Initialize template engine.
 
         Args:
             directory: Direct path or list of directory paths from which to serve templates.
+            module_directory: Optional directory in which mako caches the compiled template modules, so templates
+                are not recompiled on every process start.
         """
         super().__init__(directory=directory)
         self.engine = TemplateLookup(
-            directories=directory if isinstance(directory, (list, tuple)) else [directory], default_filters=["h"]
+            directories=directory if isinstance(directory, (list, tuple)) else [directory],
+            default_filters=["h"],
+            module_directory=module_directory,
         )
         self._template_callables: list[tuple[str, Callable[[dict[str, Any]], Any]]] = []
+        self._templates: dict[str, MakoTemplate] = {}
         self.register_template_callable(key="url_for_static_asset", template_callable=url_for_static_asset)  # type: ignore
         self.register_template_callable(key="csrf_token", template_callable=csrf_token)  # type: ignore
         self.register_template_callable(key="url_for", template_callable=url_for)  # type: ignore
@@ -93,12 +97,18 @@ class MakoTemplateEngine(TemplateEngineProtocol[MakoTemplate]):
             TemplateNotFoundException: if no template is found.
         """
         try:
-            return MakoTemplate(
-                template=self.engine.get_template(template_name), template_callables=self._template_callables
-            )
+            mako_template = self.engine.get_template(template_name)
         except MakoTemplateNotFound as exc:
             raise TemplateNotFoundException(template_name=template_name) from exc
 
+        # the lookup returns a new mako template if the file changed, in which case the wrapper is recreated
+        template = self._templates.get(template_name)
+        if template is None or template.template is not mako_template:
+            template = self._templates[template_name] = MakoTemplate(
+                template=mako_template, template_callables=self._template_callables
+            )
+        return template
+
     def register_template_callable(self, key: str, template_callable: Callable[[dict[str, Any]], Any]) -> None:
         """Register a callable on the template engine.
 
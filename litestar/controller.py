@@ -49,6 +49,7 @@ class Controller:
         "after_request",
         "after_response",
         "before_request",
+        "cache_control",
         "dependencies",
         "dto",
         "etag",
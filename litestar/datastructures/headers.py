@@ -86,7 +86,7 @@ class Headers(CIMultiDictProxy[str], MultiMixin[str]):
             ValueError: If the message does not have a ``headers`` key
         """
         if "_headers" not in scope:
-            scope["_headers"] = parse_headers(tuple(scope["headers"]))  # type: ignore
+            scope["_headers"] = parse_headers(scope["headers"])  # type: ignore
         return cls(scope["_headers"])  # type: ignore
 
     def to_header_list(self) -> "RawHeadersList":
@@ -50,6 +50,7 @@ class BaseRouteHandler:
         "_parsed_fn_signature",
         "_parsed_return_field",
         "_resolved_data_dto",
+        "_resolved_default_deserializer",
         "_resolved_dependencies",
         "_resolved_guards",
         "_resolved_layered_parameters",
@@ -117,6 +118,7 @@ class BaseRouteHandler:
         self._parsed_return_field: FieldDefinition | EmptyType = Empty
         self._parsed_data_field: FieldDefinition | None | EmptyType = Empty
         self._resolved_data_dto: type[AbstractDTO] | None | EmptyType = Empty
+        self._resolved_default_deserializer: Callable[[Any, Any], Any] | EmptyType = Empty
         self._resolved_dependencies: dict[str, Provide] | EmptyType = Empty
         self._resolved_guards: list[Guard] | EmptyType = Empty
         self._resolved_layered_parameters: dict[str, FieldDefinition] | EmptyType = Empty
@@ -160,11 +162,17 @@ class BaseRouteHandler:
     def default_deserializer(self) -> Callable[[Any, Any], Any]:
         """Get a default deserializer for the route handler.
 
+        This property is memoized so the partial is only created once, rather than on every request.
+
         Returns:
             A default deserializer for the route handler.
 
         """
-        return partial(default_deserializer, type_decoders=self.resolve_type_decoders())
+        if self._resolved_default_deserializer is Empty:
+            self._resolved_default_deserializer = partial(
+                default_deserializer, type_decoders=self.resolve_type_decoders()
+            )
+        return cast("Callable[[Any, Any], Any]", self._resolved_default_deserializer)
 
     @property
     def default_serializer(self) -> Callable[[Any], Any]:
@@ -423,13 +431,16 @@ class BaseRouteHandler:
             ):
                 data_dto: type[AbstractDTO] | None = data_dtos[-1]
             elif self.parsed_data_field and (
-                plugins_for_data_type := [
-                    plugin
-                    for plugin in self.app.plugins.serialization
-                    if self.parsed_data_field.match_predicate_recursively(plugin.supports_type)
-                ]
+                plugin_for_data_type := next(
+                    (
+                        plugin
+                        for plugin in self.app.plugins.serialization
+                        if self.parsed_data_field.match_predicate_recursively(plugin.supports_type)
+                    ),
+                    None,
+                )
             ):
-                data_dto = plugins_for_data_type[0].create_dto_for_type(self.parsed_data_field)
+                data_dto = plugin_for_data_type.create_dto_for_type(self.parsed_data_field)
             else:
                 data_dto = None
 
@@ -456,12 +467,15 @@ class BaseRouteHandler:
                 [layer.return_dto for layer in self.ownership_layers if layer.return_dto is not Empty],
             ):
                 return_dto: type[AbstractDTO] | None = return_dtos[-1]
-            elif plugins_for_return_type := [
-                plugin
-                for plugin in self.app.plugins.serialization
-                if self.parsed_return_field.match_predicate_recursively(plugin.supports_type)
-            ]:
-                return_dto = plugins_for_return_type[0].create_dto_for_type(self.parsed_return_field)
+            elif plugin_for_return_type := next(
+                (
+                    plugin
+                    for plugin in self.app.plugins.serialization
+                    if self.parsed_return_field.match_predicate_recursively(plugin.supports_type)
+                ),
+                None,
+            ):
+                return_dto = plugin_for_return_type.create_dto_for_type(self.parsed_return_field)
             else:
                 return_dto = self.resolve_data_dto()
 
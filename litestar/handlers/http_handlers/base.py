@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import TYPE_CHECKING, AnyStr, Mapping, TypedDict, cast
+from typing import TYPE_CHECKING, AnyStr, Mapping, cast
 
 from litestar._layers.utils import narrow_response_cookies, narrow_response_headers
 from litestar.datastructures.cookie import Cookie
@@ -61,10 +61,14 @@ if TYPE_CHECKING:
 
 __all__ = ("HTTPRouteHandler", "route")
 
+_NO_BODY_STATUSES = frozenset((HTTP_204_NO_CONTENT, HTTP_304_NOT_MODIFIED))
 
-class ResponseHandlerMap(TypedDict):
-    default_handler: Callable[[Any], Awaitable[ASGIApp]] | EmptyType
-    response_type_handler: Callable[[Any], Awaitable[ASGIApp]] | EmptyType
+
+def _wrap_hook(hook: Callable[..., Any] | None) -> AsyncCallable | None:
+    """Wrap a lifecycle hook in an :class:`AsyncCallable <.utils.AsyncCallable>`, unless it already is one."""
+    if hook is None or isinstance(hook, AsyncCallable):
+        return hook
+    return AsyncCallable(hook)
 
 
 class HTTPRouteHandler(BaseRouteHandler):
@@ -74,9 +78,16 @@ class HTTPRouteHandler(BaseRouteHandler):
     """
 
     __slots__ = (
+        "_default_response_handler",
+        "_resolved_after_request",
         "_resolved_after_response",
         "_resolved_before_request",
-        "_response_handler_mapping",
+        "_resolved_response_class",
+        "_resolved_response_cookies",
+        "_resolved_response_headers",
+        "_resolved_security",
+        "_resolved_tags",
+        "_response_type_handler",
         "after_request",
         "after_response",
         "background",
@@ -246,18 +257,22 @@ class HTTPRouteHandler(BaseRouteHandler):
             **kwargs,
         )
 
-        self.after_request = AsyncCallable(after_request) if after_request else None  # type: ignore[arg-type]
-        self.after_response = AsyncCallable(after_response) if after_response else None
+        self.after_request = _wrap_hook(after_request)
+        self.after_response = _wrap_hook(after_response)
         self.background = background
-        self.before_request = AsyncCallable(before_request) if before_request else None
+        self.before_request = _wrap_hook(before_request)
         self.cache = cache
         self.cache_control = cache_control
         self.cache_key_builder = cache_key_builder
         self.etag = etag
         self.media_type: MediaType | str = media_type or ""
         self.response_class = response_class
-        self.response_cookies: Sequence[Cookie] | None = narrow_response_cookies(response_cookies)
-        self.response_headers: Sequence[ResponseHeader] | None = narrow_response_headers(response_headers)
+        self.response_cookies: Sequence[Cookie] | None = (
+            narrow_response_cookies(response_cookies) if response_cookies is not None else None
+        )
+        self.response_headers: Sequence[ResponseHeader] | None = (
+            narrow_response_headers(response_headers) if response_headers is not None else None
+        )
 
         self.sync_to_thread = sync_to_thread
         # OpenAPI related attributes
@@ -275,9 +290,16 @@ class HTTPRouteHandler(BaseRouteHandler):
         self.security = security
         self.responses = responses
         # memoized attributes, defaulted to Empty
+        self._resolved_after_request: AsyncCallable | None | EmptyType = Empty
         self._resolved_after_response: AsyncCallable | None | EmptyType = Empty
         self._resolved_before_request: AsyncCallable | None | EmptyType = Empty
-        self._response_handler_mapping: ResponseHandlerMap = {"default_handler": Empty, "response_type_handler": Empty}
+        self._resolved_response_class: type[Response] | EmptyType = Empty
+        self._resolved_response_cookies: frozenset[Cookie] | EmptyType = Empty
+        self._resolved_response_headers: frozenset[ResponseHeader] | EmptyType = Empty
+        self._resolved_security: tuple[SecurityRequirement, ...] | EmptyType = Empty
+        self._resolved_tags: tuple[str, ...] | EmptyType = Empty
+        self._default_response_handler: Callable[[Any], Awaitable[ASGIApp]] | EmptyType = Empty
+        self._response_type_handler: Callable[[Any], Awaitable[ASGIApp]] | EmptyType = Empty
 
     def __call__(self, fn: AnyCallable) -> HTTPRouteHandler:
         """Replace a function with itself."""
@@ -298,61 +320,67 @@ class HTTPRouteHandler(BaseRouteHandler):
         Returns:
             The default :class:`Response <.response.Response>` class for the route handler.
         """
-        return next(
-            (
-                layer.response_class
-                for layer in list(reversed(self.ownership_layers))
-                if layer.response_class is not None
-            ),
-            Response,
-        )
+        if self._resolved_response_class is Empty:
+            self._resolved_response_class = next(
+                (layer.response_class for layer in reversed(self.ownership_layers) if layer.response_class is not None),
+                Response,
+            )
+        return self._resolved_response_class  # type: ignore[return-value]
 
     def resolve_response_headers(self) -> frozenset[ResponseHeader]:
         """Return all header parameters in the scope of the handler function.
 
+        This method is memoized so the computation occurs only once.
+
         Returns:
             A dictionary mapping keys to :class:`ResponseHeader <.datastructures.ResponseHeader>` instances.
         """
-        resolved_response_headers: dict[str, ResponseHeader] = {}
-
-        for layer in self.ownership_layers:
-            if layer_response_headers := layer.response_headers:
-                if isinstance(layer_response_headers, Mapping):
-                    # this can't happen unless you manually set response_headers on an instance, which would result in a
-                    # type-checking error on everything but the controller. We cover this case nevertheless
-                    resolved_response_headers.update(
-                        {name: ResponseHeader(name=name, value=value) for name, value in layer_response_headers.items()}
-                    )
-                else:
-                    resolved_response_headers.update({h.name: h for h in layer_response_headers})
-            for extra_header in ("cache_control", "etag"):
-                if header_model := getattr(layer, extra_header, None):
-                    resolved_response_headers[header_model.HEADER_NAME] = ResponseHeader(
-                        name=header_model.HEADER_NAME,
-                        value=header_model.to_header(),
-                        documentation_only=header_model.documentation_only,
-                    )
-
-        return frozenset(resolved_response_headers.values())
+        if self._resolved_response_headers is Empty:
+            resolved_response_headers: dict[str, ResponseHeader] = {}
+
+            for layer in self.ownership_layers:
+                if layer_response_headers := layer.response_headers:
+                    if isinstance(layer_response_headers, Mapping):
+                        # this can't happen unless you manually set response_headers on an instance, which would result
+                        # in a type-checking error on everything but the controller. We cover this case nevertheless
+                        for name, value in layer_response_headers.items():
+                            resolved_response_headers[name] = ResponseHeader(name=name, value=value)
+                    else:
+                        for header in layer_response_headers:
+                            resolved_response_headers[header.name] = header
+                for header_model in (layer.cache_control, layer.etag):
+                    if header_model:
+                        resolved_response_headers[header_model.HEADER_NAME] = ResponseHeader(
+                            name=header_model.HEADER_NAME,
+                            value=header_model.to_header(),
+                            documentation_only=header_model.documentation_only,
+                        )
+
+            self._resolved_response_headers = frozenset(resolved_response_headers.values())
+        return cast("frozenset[ResponseHeader]", self._resolved_response_headers)
 
     def resolve_response_cookies(self) -> frozenset[Cookie]:
         """Return a list of Cookie instances. Filters the list to ensure each cookie key is unique.
 
+        This method is memoized so the computation occurs only once.
+
         Returns:
             A list of :class:`Cookie <.datastructures.Cookie>` instances.
         """
-        response_cookies: set[Cookie] = set()
-        for layer in reversed(self.ownership_layers):
-            if layer_response_cookies := layer.response_cookies:
-                if isinstance(layer_response_cookies, Mapping):
-                    # this can't happen unless you manually set response_cookies on an instance, which would result in a
-                    # type-checking error on everything but the controller. We cover this case nevertheless
-                    response_cookies.update(
-                        {Cookie(key=key, value=value) for key, value in layer_response_cookies.items()}
-                    )
-                else:
-                    response_cookies.update(cast("set[Cookie]", layer_response_cookies))
-        return frozenset(response_cookies)
+        if self._resolved_response_cookies is Empty:
+            response_cookies: set[Cookie] = set()
+            for layer in reversed(self.ownership_layers):
+                if layer_response_cookies := layer.response_cookies:
+                    if isinstance(layer_response_cookies, Mapping):
+                        # this can't happen unless you manually set response_cookies on an instance, which would result
+                        # in a type-checking error on everything but the controller. We cover this case nevertheless
+                        response_cookies.update(
+                            Cookie(key=key, value=value) for key, value in layer_response_cookies.items()
+                        )
+                    else:
+                        response_cookies.update(cast("set[Cookie]", layer_response_cookies))
+            self._resolved_response_cookies = frozenset(response_cookies)
+        return cast("frozenset[Cookie]", self._resolved_response_cookies)
 
     def resolve_before_request(self) -> AsyncCallable | None:
         """Resolve the before_handler handler by starting from the route handler and moving up.
@@ -364,11 +392,27 @@ class HTTPRouteHandler(BaseRouteHandler):
             An optional :class:`before request lifecycle hook handler <.types.BeforeRequestHookHandler>`
         """
         if self._resolved_before_request is Empty:
-            before_request_handlers: list[AsyncCallable] = [
-                layer.before_request for layer in self.ownership_layers if layer.before_request  # type: ignore[misc]
-            ]
-            self._resolved_before_request = before_request_handlers[-1] if before_request_handlers else None
-        return cast("AsyncCallable | None", self._resolved_before_request)
+            self._resolved_before_request = next(
+                (layer.before_request for layer in reversed(self.ownership_layers) if layer.before_request),  # type: ignore[misc]
+                None,
+            )
+        return self._resolved_before_request  # type: ignore[return-value]
+
+    def resolve_after_request(self) -> AsyncCallable | None:
+        """Resolve the after_request handler by starting from the route handler and moving up.
+
+        If a handler is found it is returned, otherwise None is set.
+        This method is memoized so the computation occurs only once.
+
+        Returns:
+            An optional :class:`after request lifecycle hook handler <.types.AfterRequestHookHandler>`
+        """
+        if self._resolved_after_request is Empty:
+            self._resolved_after_request = next(
+                (layer.after_request for layer in reversed(self.ownership_layers) if layer.after_request),  # type: ignore[misc]
+                None,
+            )
+        return self._resolved_after_request  # type: ignore[return-value]
 
     def resolve_after_response(self) -> AsyncCallable | None:
         """Resolve the after_response handler by starting from the route handler and moving up.
@@ -380,12 +424,50 @@ class HTTPRouteHandler(BaseRouteHandler):
             An optional :class:`after response lifecycle hook handler <.types.AfterResponseHookHandler>`
         """
         if self._resolved_after_response is Empty:
-            after_response_handlers: list[AsyncCallable] = [
-                layer.after_response for layer in self.ownership_layers if layer.after_response  # type: ignore[misc]
-            ]
-            self._resolved_after_response = after_response_handlers[-1] if after_response_handlers else None
+            self._resolved_after_response = next(
+                (layer.after_response for layer in reversed(self.ownership_layers) if layer.after_response),  # type: ignore[misc]
+                None,
+            )
+
+        return self._resolved_after_response  # type: ignore[return-value]
+
+    def resolve_tags(self) -> tuple[str, ...]:
+        """Resolve the tags of the route handler and all of its layers.
+
+        This method is memoized so the computation occurs only once.
 
-        return cast("AsyncCallable | None", self._resolved_after_response)
+        Returns:
+            A sorted tuple of unique tags.
+        """
+        if self._resolved_tags is Empty:
+            tags: list[str] | None = None
+            for layer in self.ownership_layers:
+                if layer.tags:
+                    if tags is None:
+                        tags = list(layer.tags)
+                    else:
+                        tags.extend(layer.tags)
+            self._resolved_tags = tuple(sorted(dict.fromkeys(tags))) if tags else ()
+        return cast("tuple[str, ...]", self._resolved_tags)
+
+    def resolve_security(self) -> tuple[SecurityRequirement, ...]:
+        """Resolve the security requirements of the route handler and all of its layers.
+
+        This method is memoized so the computation occurs only once.
+
+        Returns:
+            A tuple of :class:`SecurityRequirement <.openapi.spec.SecurityRequirement>` mappings.
+        """
+        if self._resolved_security is Empty:
+            security: list[SecurityRequirement] | None = None
+            for layer in self.ownership_layers:
+                if layer.security:
+                    if security is None:
+                        security = list(layer.security)
+                    else:
+                        security.extend(layer.security)
+            self._resolved_security = tuple(security) if security else ()
+        return cast("tuple[SecurityRequirement, ...]", self._resolved_security)
 
     def get_response_handler(self, is_response_type_data: bool = False) -> Callable[[Any], Awaitable[ASGIApp]]:
         """Resolve the response_handler function for the route handler.
@@ -398,15 +480,8 @@ class HTTPRouteHandler(BaseRouteHandler):
         Returns:
             Async Callable to handle an HTTP Request
         """
-        if self._response_handler_mapping["default_handler"] is Empty:
-            after_request_handlers: list[AsyncCallable] = [
-                layer.after_request for layer in self.ownership_layers if layer.after_request  # type: ignore[misc]
-            ]
-            after_request = cast(
-                "AfterRequestHookHandler | None",
-                after_request_handlers[-1] if after_request_handlers else None,
-            )
-
+        if self._default_response_handler is Empty:
+            after_request = cast("AfterRequestHookHandler | None", self.resolve_after_request())
             media_type = self.media_type.value if isinstance(self.media_type, Enum) else self.media_type
             response_class = self.resolve_response_class()
             headers = self.resolve_response_headers()
@@ -421,7 +496,7 @@ class HTTPRouteHandler(BaseRouteHandler):
                 if not handler_return_type.is_subclass_of((Empty, NoneType)):
                     return_annotation = handler_return_type.annotation
 
-            self._response_handler_mapping["response_type_handler"] = response_type_handler = create_response_handler(
+            self._response_type_handler = response_type_handler = create_response_handler(
                 after_request=after_request,
                 background=self.background,
                 cookies=cookies,
@@ -432,13 +507,11 @@ class HTTPRouteHandler(BaseRouteHandler):
             )
 
             if return_type.is_subclass_of(Response):
-                self._response_handler_mapping["default_handler"] = response_type_handler
+                self._default_response_handler = response_type_handler
             elif is_async_callable(return_annotation) or return_annotation is ASGIApp:
-                self._response_handler_mapping["default_handler"] = create_generic_asgi_response_handler(
-                    after_request=after_request
-                )
+                self._default_response_handler = create_generic_asgi_response_handler(after_request=after_request)
             else:
-                self._response_handler_mapping["default_handler"] = create_data_handler(
+                self._default_response_handler = create_data_handler(
                     after_request=after_request,
                     background=self.background,
                     cookies=cookies,
@@ -449,12 +522,7 @@ class HTTPRouteHandler(BaseRouteHandler):
                     type_encoders=type_encoders,
                 )
 
-        return cast(
-            "Callable[[Any], Awaitable[ASGIApp]]",
-            self._response_handler_mapping["response_type_handler"]
-            if is_response_type_data
-            else self._response_handler_mapping["default_handler"],
-        )
+        return self._response_type_handler if is_response_type_data else self._default_response_handler  # type: ignore[return-value]
 
     async def to_response(self, app: Litestar, data: Any, request: Request) -> ASGIApp:
         """Return a :class:`Response <.response.Response>` from the handler by resolving and calling it.
@@ -491,7 +559,8 @@ class HTTPRouteHandler(BaseRouteHandler):
         """Validate the route handler function once it is set by inspecting its return annotations."""
         super()._validate_handler_function()
 
-        return_type = self.parsed_fn_signature.return_type
+        parsed_signature = self.parsed_fn_signature
+        return_type = parsed_signature.return_type
 
         if return_type.annotation is Empty:
             raise ImproperlyConfiguredException(
@@ -499,20 +568,17 @@ class HTTPRouteHandler(BaseRouteHandler):
                 "If your function doesn't return a value, annotate it as returning 'None'."
             )
 
-        if (
-            self.status_code < 200 or self.status_code in {HTTP_204_NO_CONTENT, HTTP_304_NOT_MODIFIED}
-        ) and not return_type.is_subclass_of(NoneType):
+        has_no_body = self.status_code < 200 or self.status_code in _NO_BODY_STATUSES
+        if has_no_body and not return_type.is_subclass_of(NoneType):
             raise ImproperlyConfiguredException(
                 "A status code 204, 304 or in the range below 200 does not support a response body."
                 "If the function should return a value, change the route handler status code to an appropriate value.",
             )
 
-        if (
-            (before_request := self.resolve_before_request())
-            and not before_request.parsed_signature.return_type.is_subclass_of(NoneType)
-            and not before_request.parsed_signature.return_type.is_optional
-        ):
-            return_type = before_request.parsed_signature.return_type
+        if before_request := self.resolve_before_request():
+            before_request_return_type = before_request.parsed_signature.return_type
+            if not (before_request_return_type.is_subclass_of(NoneType) or before_request_return_type.is_optional):
+                return_type = before_request_return_type
 
         if not self.media_type:
             if return_type.is_subclass_of((str, bytes)) or return_type.annotation is AnyStr:
@@ -520,10 +586,10 @@ class HTTPRouteHandler(BaseRouteHandler):
             elif not return_type.is_subclass_of(Response):
                 self.media_type = MediaType.JSON
 
-        if "socket" in self.parsed_fn_signature.parameters:
+        if "socket" in parsed_signature.parameters:
             raise ImproperlyConfiguredException("The 'socket' kwarg is not supported with http handlers")
 
-        if "data" in self.parsed_fn_signature.parameters and "GET" in self.http_methods:
+        if "data" in parsed_signature.parameters and "GET" in self.http_methods:
             raise ImproperlyConfiguredException("'data' kwarg is unsupported for 'GET' request handlers")
 
 
@@ -43,6 +43,9 @@ __all__ = ("get", "head", "post", "put", "patch", "delete")
 
 MSG_SEMANTIC_ROUTE_HANDLER_WITH_HTTP = "semantic route handlers cannot define http_method"
 
+_HEAD_RESPONSE_FILE_TYPES = (File, ASGIFileResponse)
+_NONE_ANNOTATIONS = frozenset((NoneType, None))
+
 
 class delete(HTTPRouteHandler):
     """DELETE Route Decorator.
@@ -548,9 +551,8 @@ class head(HTTPRouteHandler):
         # we allow here File and File because these have special setting for head responses
         return_annotation = self.parsed_fn_signature.return_type.annotation
         if not (
-            return_annotation in {NoneType, None}
-            or is_class_and_subclass(return_annotation, File)
-            or is_class_and_subclass(return_annotation, ASGIFileResponse)
+            return_annotation in _NONE_ANNOTATIONS
+            or is_class_and_subclass(return_annotation, _HEAD_RESPONSE_FILE_TYPES)
         ):
             raise ImproperlyConfiguredException("A response to a head request should not have a body")
 
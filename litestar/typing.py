@@ -234,8 +234,10 @@ class FieldDefinition:
         if is_pydantic_constrained_field(annotation) or isinstance(annotation, AbstractDTO):
             return _create_metadata_from_type(metadata=[annotation], model=model, annotation=annotation, extra=extra)
 
-        if any(isinstance(arg, KwargDefinition) for arg in get_args(annotation)):
-            return next(arg for arg in get_args(annotation) if isinstance(arg, KwargDefinition)), extra or {}
+        if (
+            kwarg_definition := next((arg for arg in get_args(annotation) if isinstance(arg, KwargDefinition)), None)
+        ) is not None:
+            return kwarg_definition, extra or {}
 
         if metadata:
             return _create_metadata_from_type(metadata=metadata, model=model, annotation=annotation, extra=extra)
@@ -0,0 +1,31 @@
+from typing import Any
+
+import pytest
+
+from litestar import HttpMethod
+from litestar.handlers.http_handlers import HTTPRouteHandler
+from litestar.utils import AsyncCallable
+
+
+async def async_hook(value: Any) -> None:
+    return None
+
+
+@pytest.mark.parametrize("hook_name", ["after_request", "after_response", "before_request"])
+def test_route_handler_wraps_hooks_in_async_callable(hook_name: str) -> None:
+    route_handler = HTTPRouteHandler(http_method=HttpMethod.GET, **{hook_name: async_hook})
+    hook = getattr(route_handler, hook_name)
+    assert isinstance(hook, AsyncCallable)
+    assert hook.ref.value is async_hook
+
+
+@pytest.mark.parametrize("hook_name", ["after_request", "after_response", "before_request"])
+def test_route_handler_does_not_rewrap_async_callable_hooks(hook_name: str) -> None:
+    hook = AsyncCallable(async_hook)
+    route_handler = HTTPRouteHandler(http_method=HttpMethod.GET, **{hook_name: hook})
+    assert getattr(route_handler, hook_name) is hook
+
+
+@pytest.mark.parametrize("hook_name", ["after_request", "after_response", "before_request"])
+def test_route_handler_hooks_default_to_none(hook_name: str) -> None:
+    assert getattr(HTTPRouteHandler(http_method=HttpMethod.GET), hook_name) is None
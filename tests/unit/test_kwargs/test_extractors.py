@@ -0,0 +1,36 @@
+import traceback
+from typing import Any, Dict
+
+import pytest
+
+from litestar._kwargs.extractors import create_connection_value_extractor
+from litestar._kwargs.parameter_definition import ParameterDefinition
+from litestar.enums import ParamType
+from litestar.exceptions import ValidationException
+from litestar.testing import RequestFactory
+
+
+def test_connection_value_extractor_missing_parameter_traceback() -> None:
+    extractor = create_connection_value_extractor(
+        kwargs_model=None,  # type: ignore[arg-type]
+        connection_key="headers",
+        expected_params={
+            ParameterDefinition(
+                default=None,
+                field_alias="x-token",
+                field_name="token",
+                is_required=True,
+                is_sequence=False,
+                param_type=ParamType.HEADER,
+            )
+        },
+    )
+    values: Dict[str, Any] = {}
+
+    with pytest.raises(ValidationException) as exc_info:
+        extractor(values, RequestFactory().get("/"))
+
+    assert isinstance(exc_info.value.__cause__, KeyError)
+    formatted = "".join(traceback.format_exception(exc_info.type, exc_info.value, exc_info.tb))
+    assert "The above exception was the direct cause of the following exception" in formatted
+    assert "raise missing_parameter_exception(e.args[0], connection) from e" in formatted
@@ -397,6 +397,16 @@ def test_image_upload() -> None:
         assert response.status_code == HTTP_201_CREATED
 
 
+def test_upload_file_without_file_part() -> None:
+    @post("/")
+    async def hello_world(data: UploadFile = Body(media_type=RequestEncodingType.MULTI_PART)) -> None:
+        await data.read()
+
+    with create_test_client(route_handlers=[hello_world]) as client:
+        response = client.post("/", data={"foo": "bar"}, files={"baz": ("", b"", "text/plain")})
+        assert response.status_code == HTTP_400_BAD_REQUEST
+
+
 def test_optional_formdata() -> None:
     @post("/")
     async def hello_world(data: Optional[UploadFile] = Body(media_type=RequestEncodingType.MULTI_PART)) -> None:
@@ -221,3 +221,21 @@ def test_query_param_dependency_with_alias() -> None:
         response = client.get("/?pageSize=1")
         assert response.status_code == HTTP_200_OK, response.text
         assert response.text == "1"
+
+
+@pytest.mark.parametrize("alias", ("it's", 'say "hi"', "back\\slash", "new\nline"))
+def test_query_param_alias_with_special_characters(alias: str) -> None:
+    @get("/", media_type=MediaType.TEXT)
+    def handler(
+        value: str = Parameter(query=alias), optional_value: Optional[str] = Parameter(query=alias + "_")
+    ) -> str:
+        return f"{value}-{optional_value}"
+
+    with create_test_client(handler) as client:
+        response = client.get("/", params={alias: "1"})
+        assert response.status_code == HTTP_200_OK, response.text
+        assert response.text == "1-None"
+
+        response = client.get("/")
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert f"Missing required parameter {alias}" in response.json()["detail"]
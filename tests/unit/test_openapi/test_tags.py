@@ -2,7 +2,7 @@ from typing import TYPE_CHECKING, Any, Type
 
 import pytest
 
-from litestar import Controller, Litestar, Router, get
+from litestar import Controller, Litestar, Router, get, route
 from litestar.handlers.http_handlers import HTTPRouteHandler
 
 if TYPE_CHECKING:
@@ -56,3 +56,26 @@ def test_openapi_schema_controller_tags(openapi_schema: "OpenAPI") -> None:
 
 def test_openapi_schema_router_tags(openapi_schema: "OpenAPI") -> None:
     assert openapi_schema.paths["/router/controller"].get.tags == ["a", "controller", "handler", "router"]  # type: ignore
+
+
+def test_openapi_schema_operations_do_not_share_layered_values() -> None:
+    @route("/", http_method=["GET", "POST"], tags=["a"], security=[{"BearerToken": []}])
+    def _handler() -> None:
+        ...
+
+    path_item = Litestar(route_handlers=[_handler]).openapi_schema.paths["/"]  # type: ignore[index]
+    get_operation, post_operation = path_item.get, path_item.post
+    assert get_operation and post_operation
+    assert get_operation.tags is not post_operation.tags
+    assert get_operation.security is not post_operation.security
+
+    get_operation.tags.append("x")  # type: ignore[union-attr]
+    get_operation.security.append({"ApiKey": []})  # type: ignore[union-attr]
+
+    assert post_operation.tags == ["a"]
+    assert post_operation.security == [{"BearerToken": []}]
+
+    rebuilt_operation = Litestar(route_handlers=[_handler]).openapi_schema.paths["/"].post  # type: ignore[index]
+    assert rebuilt_operation
+    assert rebuilt_operation.tags == ["a"]
+    assert rebuilt_operation.security == [{"BearerToken": []}]
@@ -1,6 +1,6 @@
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, Union
 
 import pytest
 
@@ -67,6 +67,39 @@ def test_directory_validation(engine: Type["TemplateEngineProtocol"], tmp_path:
         TemplateConfig(engine=engine)
 
 
+def test_mako_engine_reuses_template_wrapper(tmp_path: Path) -> None:
+    (tmp_path / "hello.mako").write_text("hello")
+    engine = MakoTemplateEngine(tmp_path)
+
+    template = engine.get_template("hello.mako")
+    assert engine.get_template("hello.mako") is template
+    assert template.render() == "hello"
+
+
+def test_mako_template_callable_context_holds_earlier_callables(tmp_path: Path) -> None:
+    (tmp_path / "callables.mako").write_text("${builtin_callables()}")
+    engine = MakoTemplateEngine(tmp_path)
+
+    def builtin_callables(ctx: Dict[str, Any]) -> str:
+        return ",".join(sorted(key for key in ("csrf_token", "url_for", "url_for_static_asset") if key in ctx))
+
+    engine.register_template_callable(key="builtin_callables", template_callable=builtin_callables)
+
+    assert engine.get_template("callables.mako").render() == "csrf_token,url_for,url_for_static_asset"
+
+
+def test_mako_engine_module_directory(tmp_path: Path) -> None:
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    (template_dir / "hello.mako").write_text("hello")
+    module_dir = tmp_path / "modules"
+
+    engine = MakoTemplateEngine(template_dir, module_directory=str(module_dir))
+
+    assert engine.get_template("hello.mako").render() == "hello"
+    assert list(module_dir.rglob("hello.mako.py"))
+
+
 @pytest.mark.parametrize("media_type", [MediaType.HTML, MediaType.TEXT, "text/arbitrary"])
 def test_media_type(media_type: Union[MediaType, str], tmp_path: Path) -> None:
     (tmp_path / "hello.tpl").write_text("hello")